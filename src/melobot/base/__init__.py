@@ -22,4 +22,4 @@ from .tools import (
     to_async,
     to_coro,
 )
-from .typing import LogicMode, ParseArgs, PriorLevel, User
+from .typing import EventKind, LogicMode, ParseArgs, PriorLevel, User
@@ -12,6 +12,7 @@ from .typing import (
     AsyncCallable,
     BotLife,
     Callable,
+    EventKind,
     Generic,
     Literal,
     LogicMode,
@@ -41,6 +42,11 @@ class AbstractConnector(ABC):
        一般无需手动实例化该类，多数情况会直接使用本类对象，或将本类用作类型注解。
     """
 
+    #: 发送队列最多容纳的待发送 action 数
+    MAX_PENDING_ACTIONS: int = 1024
+    #: 发送队列已满时，等待队列空出位置的最长时间。超时后 action 将被丢弃
+    SEND_ENQUEUE_TIMEOUT: float = 10
+
     def __init__(self, cd_time: float, allow_reconnect: bool = False) -> None:
         super().__init__()
         #: 连接器的日志器
@@ -54,6 +60,8 @@ class AbstractConnector(ABC):
 
         self._used: bool = False
         self._ready_signal = asyncio.Event()
+        self._conn_ready = asyncio.Event()
+        self._fully_ready = asyncio.Event()
         self._closed = asyncio.Event()
 
         self._event_builder: Type["BotEventBuilder"]
@@ -78,6 +86,17 @@ class AbstractConnector(ABC):
 
     def _set_ready(self) -> None:
         self._ready_signal.set()
+        self._sync_ready_gate()
+
+    def _sync_ready_gate(self) -> None:
+        """同步总就绪门。bot 已就绪且连接已建立时才设置，任一条件不满足时清除
+
+        每次修改 `_ready_signal` 或 `_conn_ready` 后都必须调用本方法
+        """
+        if self._ready_signal.is_set() and self._conn_ready.is_set():
+            self._fully_ready.set()
+        else:
+            self._fully_ready.clear()
 
     def _bind(
         self,
@@ -93,6 +112,51 @@ class AbstractConnector(ABC):
         self._common_dispatcher = dispatcher
         self._resp_dispatcher = responder
 
+    async def _prepare_action(self, action: "BotAction") -> bool:
+        """action 入队前的公共处理：slack 检查、调试输出与 presend hook
+
+        presend hook 在 action 入队（及序列化）前执行，因此 hook 中仍可修改 action
+
+        :return: action 是否应继续入队（slack 状态下为 :obj:`False`）
+        """
+        debug = self.logger._check_level("DEBUG")
+        if self.slack:
+            if debug:
+                self.logger.debug(f"action {action:hexid} 因 slack 状态被丢弃")
+            return False
+
+        if debug:
+            self.logger.obj(
+                action.__dict__, f"action {action:hexid} 准备发送", pretty=False
+            )
+        if self._bot_bus.has_hooks(BotLife.ACTION_PRESEND):
+            await self._bot_bus.emit(BotLife.ACTION_PRESEND, action, wait=True)
+            if debug:
+                self.logger.debug(f"action {action:hexid} presend hook 已完成")
+        return True
+
+    async def _queue_put(self, queue: asyncio.Queue[Any], item: Any) -> bool:
+        """将 item 放入发送队列。队列已满时最多等待 `SEND_ENQUEUE_TIMEOUT` 秒
+
+        :return: 是否成功入队（等待超时为 :obj:`False`）
+        """
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(queue.put(item), self.SEND_ENQUEUE_TIMEOUT)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    def _drop_action(self, action: "BotAction") -> None:
+        """发送队列已满且等待超时，丢弃 action。若 action 需要等待响应，该等待以异常结束"""
+        self.logger.warning(f"发送队列已满且等待超时，action {action:hexid} 被丢弃")
+        if action.resp_id is not None:
+            self._resp_dispatcher._fail_wait(
+                action.resp_id, BotRuntimeError("action 因发送队列已满被丢弃")
+            )
+
     @abstractmethod
     async def _send(self, action: "BotAction") -> None:
         raise NotImplementedError
@@ -104,14 +168,14 @@ class Flagable:
 
     def mark(self, namespace: str, flag_name: str, val: Any = None) -> None:
         """为对象添加在指定命名空间下，名为 flag_name 的标记。 此后此对象会一直携带此标记，无法撤销。"""
-        self._flags_store.setdefault(namespace, {})
+        flags = self._flags_store.setdefault(namespace, {})
 
-        if self._flags_store[namespace].get(flag_name) is not None:
+        if flags.get(flag_name) is not None:
             raise BotUtilsError(
                 f"标记失败。对象的命名空间 {namespace} 中已存在名为 {flag_name} 的标记"
             )
 
-        self._flags_store[namespace][flag_name] = val
+        flags[flag_name] = val
 
     def flag_check(self, namespace: str, flag_name: str, val: Any = None) -> bool:
         """检查此对象是否携带有指定的标记"""
@@ -129,6 +193,14 @@ class Cloneable:
         return deepcopy(self)
 
 
+_EVENT_KIND_MAP = {
+    "message": EventKind.MESSAGE,
+    "request": EventKind.REQUEST,
+    "notice": EventKind.NOTICE,
+    "meta": EventKind.META,
+}
+
+
 class BotEvent(ABC, Flagable):
     """事件基类
 
@@ -164,21 +236,30 @@ class BotEvent(ABC, Flagable):
         """事件类型"""
         raise NotImplementedError
 
+    @property
+    def kind(self) -> Optional[EventKind]:
+        """事件类型的枚举值
+
+        内置事件类以类属性直接给出。未给出的子类会由 :attr:`type` 推得，
+        因此自定义事件类只需实现 :attr:`type`（无法对应时为 :obj:`None`）
+        """
+        return _EVENT_KIND_MAP.get(self.type)
+
     def is_msg_event(self) -> bool:
         """判断是否是消息事件"""
-        return self.type == "message"
+        return self.kind is EventKind.MESSAGE
 
     def is_req_event(self) -> bool:
         """判断是否是请求事件"""
-        return self.type == "request"
+        return self.kind is EventKind.REQUEST
 
     def is_notice_event(self) -> bool:
         """判断是否是通知事件"""
-        return self.type == "notice"
+        return self.kind is EventKind.NOTICE
 
     def is_meta_event(self) -> bool:
         """判断是否是元事件"""
-        return self.type == "meta"
+        return self.kind is EventKind.META
 
 
 Event_T = TypeVar("Event_T", bound=BotEvent)
@@ -296,7 +377,7 @@ class CustomSessionRule(SessionRule[Event_T]):
         return self.meth(e1, e2)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventHandlerArgs:
     """事件方法（事件执行器）构造参数"""
 
@@ -305,7 +386,7 @@ class EventHandlerArgs:
     params: list[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ShareObjArgs:
     """插件共享对象构造参数"""
 
@@ -314,7 +395,7 @@ class ShareObjArgs:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ShareObjCbArgs:
     """插件共享对象回调的构造参数"""
 
@@ -323,7 +404,7 @@ class ShareObjCbArgs:
     cb: AsyncCallable[..., Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginSignalHandlerArgs:
     """插件信号方法构造参数"""
 
@@ -332,7 +413,7 @@ class PluginSignalHandlerArgs:
     signal: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BotHookRunnerArgs:
     """钩子方法（生命周期回调）构造参数"""
 
@@ -1,11 +1,11 @@
 import asyncio
-import inspect
-import os
 import pathlib
+import sys
 import time
+import types
 import uuid
-from contextlib import asynccontextmanager
 from functools import wraps
+from itertools import count
 
 from .exceptions import BotRuntimeError, BotValidateError
 from .typing import (
@@ -64,6 +64,45 @@ def get_twin_event() -> tuple[asyncio.Event, asyncio.Event]:
     return a, b
 
 
+class _RWReadCtx:
+    __slots__ = ("_rwc",)
+
+    def __init__(self, rwc: "RWController") -> None:
+        self._rwc = rwc
+
+    async def __aenter__(self) -> None:
+        rwc = self._rwc
+        if rwc._read_semaphore:
+            await rwc._read_semaphore.acquire()
+
+        async with rwc._read_num_lock:
+            if rwc._read_num == 0:
+                await rwc._write_semaphore.acquire()
+            rwc._read_num += 1
+
+    async def __aexit__(self, *_: Any) -> None:
+        rwc = self._rwc
+        async with rwc._read_num_lock:
+            rwc._read_num -= 1
+            if rwc._read_num == 0:
+                rwc._write_semaphore.release()
+            if rwc._read_semaphore:
+                rwc._read_semaphore.release()
+
+
+class _RWWriteCtx:
+    __slots__ = ("_rwc",)
+
+    def __init__(self, rwc: "RWController") -> None:
+        self._rwc = rwc
+
+    async def __aenter__(self) -> None:
+        await self._rwc._write_semaphore.acquire()
+
+    async def __aexit__(self, *_: Any) -> None:
+        self._rwc._write_semaphore.release()
+
+
 class RWController:
     """异步读写控制器
 
@@ -87,53 +126,39 @@ class RWController:
 
         :param read_limit: 读取的数量限制，为空则不限制
         """
-        write_semaphore = asyncio.Semaphore(1)
-        read_semaphore = asyncio.Semaphore(read_limit) if read_limit else None
-        read_num = 0
-        read_num_lock = asyncio.Lock()
+        self._write_semaphore = asyncio.Semaphore(1)
+        self._read_semaphore = asyncio.Semaphore(read_limit) if read_limit else None
+        self._read_num = 0
+        self._read_num_lock = asyncio.Lock()
 
-        @asynccontextmanager
-        async def safe_read():
-            nonlocal read_num, read_semaphore, write_semaphore, read_num_lock
+        # 上下文对象不保存状态，可以复用
+        self._read_ctx = _RWReadCtx(self)
+        self._write_ctx = _RWWriteCtx(self)
 
-            if read_semaphore:
-                await read_semaphore.acquire()
+    def safe_read(self) -> _RWReadCtx:
+        """获取安全读上下文"""
+        return self._read_ctx
 
-            async with read_num_lock:
-                if read_num == 0:
-                    await write_semaphore.acquire()
-                read_num += 1
+    def safe_write(self) -> _RWWriteCtx:
+        """获取安全写上下文"""
+        return self._write_ctx
 
-            try:
-                yield
-            finally:
-                async with read_num_lock:
-                    read_num -= 1
-                    if read_num == 0:
-                        write_semaphore.release()
-                    if read_semaphore:
-                        read_semaphore.release()
-
-        @asynccontextmanager
-        async def safe_write():
-            nonlocal write_semaphore
-
-            await write_semaphore.acquire()
-            try:
-                yield
-            finally:
-                write_semaphore.release()
 
-        self.safe_read = safe_read
-        self.safe_write = safe_write
+_ID_BASE = uuid.uuid4().hex
+_ID_COUNTER = count()
 
 
 def get_id() -> str:
     """从 melobot 内部 id 获取器获得一个 id 值，不保证线程安全。
 
+    id 由进程启动时生成的随机前缀与自增序号拼接而成，保证在当前进程内唯一。
+
     :return: id 值
     """
-    return uuid.uuid4().hex
+    return f"{_ID_BASE}{next(_ID_COUNTER)}"
+
+
+_THIS_DIR_CACHE: dict[tuple[str, tuple[str, ...]], str] = {}
 
 
 def this_dir(*relative_path: str) -> str:
@@ -181,35 +206,50 @@ def this_dir(*relative_path: str) -> str:
     :param relative_path: 可用于拼接的路径部分
     :return: 拼接后的绝对路径
     """
-    cur_finfo: inspect.FrameInfo | None = None
-    cur_idx: int
-    caller_path: str | None = None
-    stacks = inspect.stack()
-
-    for idx, finfo in enumerate(stacks):
-        if finfo.function == "this_dir" and os.path.samefile(finfo.filename, __file__):
-            cur_finfo, cur_idx = finfo, idx
+    # 最常见的情况是在模块顶层直接调用，此时调用方帧就是所需的模块帧，
+    # 无需遍历栈帧，也无需扫描模块变量
+    direct_caller = sys._getframe(1)
+    if direct_caller.f_code.co_name == "<module>":
+        caller_path: str | None = direct_caller.f_code.co_filename
+    else:
+        caller_path = _find_this_dir_caller()
 
-    if cur_finfo is None:
+    if caller_path is None:
         raise BotRuntimeError("this_dir 定位失败，请检查本函数使用方式是否正确")
 
-    for idx, finfo in enumerate(stacks[cur_idx + 1 :]):
-
-        if finfo.function == "<module>":
-            for val in finfo.frame.f_locals.values():
+    key = (caller_path, relative_path)
+    if (path := _THIS_DIR_CACHE.get(key)) is None:
+        path = str(
+            pathlib.Path(caller_path).parent.joinpath(*relative_path).resolve(strict=True)
+        )
+        _THIS_DIR_CACHE[key] = path
+    return path
+
+
+def _find_this_dir_caller() -> str | None:
+    """在非模块顶层调用 :func:`this_dir` 时，从栈帧中找到导入了 :func:`this_dir` 的模块"""
+    # 只沿 f_back 遍历栈帧，不像 inspect.stack() 那样读取每一帧的源码上下文
+    cur_frame: types.FrameType | None = None
+
+    frame: types.FrameType | None = sys._getframe()
+    while frame is not None:
+        if frame.f_code is __dir_inspector__.__code__:
+            cur_frame = frame
+        frame = frame.f_back
+
+    if cur_frame is None:
+        return None
+
+    frame = cur_frame.f_back
+    while frame is not None:
+        if frame.f_code.co_name == "<module>":
+            for val in frame.f_locals.values():
                 if val is __dir_inspector__:
-                    caller_path = finfo.filename
-                    break
-
-            if caller_path is not None:
-                break
+                    return frame.f_code.co_filename
 
-    if caller_path is None:
-        raise BotRuntimeError("this_dir 定位失败，请检查本函数使用方式是否正确")
+        frame = frame.f_back
 
-    return str(
-        pathlib.Path(caller_path).parent.joinpath(*relative_path).resolve(strict=True)
-    )
+    return None
 
 
 __dir_inspector__ = this_dir
@@ -515,10 +555,11 @@ def call_at(callback: Callable[[], None], timestamp: float):
     :return: :class:`asyncio.TimerHandle` 对象
     """
     loop = asyncio.get_running_loop()
-    if timestamp <= time.time_ns() / 1e9:
+    delay = timestamp - time.time()
+    if delay <= 0:
         return loop.call_soon(callback)
     else:
-        return loop.call_later(timestamp - time.time_ns() / 1e9, callback)
+        return loop.call_later(delay, callback)
 
 
 def async_later(callback: Coroutine[Any, Any, Any], delay: float) -> asyncio.Future[T]:
@@ -535,16 +576,37 @@ def async_later(callback: Coroutine[Any, Any, Any], delay: float) -> asyncio.Fut
     :return: :class:`asyncio.Future` 对象
     """
 
-    async def async_cb(fut: asyncio.Future) -> Any:
-        try:
-            await asyncio.sleep(delay)
-            res = await callback
-            fut.set_result(res)
-        except asyncio.CancelledError:
+    loop = asyncio.get_running_loop()
+    fut: asyncio.Future[Any] = loop.create_future()
+    task: Optional[asyncio.Task[Any]] = None
+
+    # 延迟由事件循环的定时器完成，到时间后才为 callback 创建任务
+    def run_cb() -> None:
+        nonlocal task
+        task = loop.create_task(callback)
+        task.add_done_callback(set_fut)
+
+    def set_fut(t: asyncio.Task[Any]) -> None:
+        if fut.done():
+            return
+        if t.cancelled():
+            fut.cancel()
+        elif (e := t.exception()) is not None:
+            fut.set_exception(e)
+        else:
+            fut.set_result(t.result())
+
+    def cancel_cb(_: asyncio.Future[Any]) -> None:
+        if not fut.cancelled():
+            return
+        handle.cancel()
+        if task is not None:
+            task.cancel()
+        else:
             callback.close()
 
-    fut: asyncio.Future[Any] = asyncio.Future()
-    asyncio.create_task(async_cb(fut))
+    handle = loop.call_later(delay, run_cb)
+    fut.add_done_callback(cancel_cb)
     return fut
 
 
@@ -561,10 +623,11 @@ def async_at(callback: Coroutine[Any, Any, Any], timestamp: float) -> asyncio.Fu
     :param timestamp: 在什么时刻调度
     :return: :class:`asyncio.Future` 对象
     """
-    if timestamp <= time.time_ns() / 1e9:
+    delay = timestamp - time.time()
+    if delay <= 0:
         return async_later(callback, 0)
     else:
-        return async_later(callback, timestamp - time.time_ns() / 1e9)
+        return async_later(callback, delay)
 
 
 def async_interval(
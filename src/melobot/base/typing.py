@@ -1,6 +1,6 @@
 import inspect
 from enum import Enum
-from types import TracebackType
+from types import CoroutineType, TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -145,6 +145,18 @@ class BotLife(Enum):
     ACTION_PRESEND = 7
 
 
+class EventKind(int, Enum):
+    """事件类型枚举
+
+    与 :attr:`.BotEvent.type` 一一对应，用于快速判断事件类型
+    """
+
+    MESSAGE = 0
+    REQUEST = 1
+    NOTICE = 2
+    META = 3
+
+
 #: 泛型 T，无约束
 T = TypeVar("T")
 #: 泛型 T，无约束
@@ -184,7 +196,8 @@ async def async_guard(func: AsyncCallable[..., T], *args: Any, **kwargs: Any) ->
         )
 
     await_obj = func(*args, **kwargs)
-    if inspect.isawaitable(await_obj):
+    # 绝大多数情况下返回的是协程，先做开销最小的类型检查
+    if isinstance(await_obj, CoroutineType) or inspect.isawaitable(await_obj):
         return await await_obj
     raise BotValidateError(
         f"{func} 应该是异步函数，或其他异步可调用对象（返回 Awaitable 的可调用对象）。但它返回了：{await_obj}"
@@ -37,6 +37,10 @@ class BotHookBus:
         runner = HookRunner(hook_type, hook_func)
         self.store[hook_type].append(runner)
 
+    def has_hooks(self, hook_type: BotLife) -> bool:
+        """是否有注册到指定生命周期的 hook 方法"""
+        return len(self.store[hook_type]) > 0
+
     async def _run_on_ctx(self, runner: HookRunner, *args: Any, **kwargs: Any) -> None:
         try:
             await runner.cb(*args, **kwargs)
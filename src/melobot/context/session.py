@@ -231,17 +231,23 @@ class ActionHandle:
         self.status: Literal["PENDING", "EXECUTING", "FINISHED"] = "PENDING"
 
         self._resp: ActionResponse
+        self._resp_err: Optional[BotRuntimeError] = None
         self._wait = wait
         self._exec_meth = exec_meth
         self._resp_done = asyncio.Event()
 
     @property
     async def resp(self) -> ActionResponse:
-        """当前行为操作的响应数据，需要异步获取（行为操作函数 `wait` 参数为 :obj:`True` 时使用）"""
+        """当前行为操作的响应数据，需要异步获取（行为操作函数 `wait` 参数为 :obj:`True` 时使用）
+
+        行为操作未能发送时（例如发送队列已满被丢弃），将抛出 :class:`.BotRuntimeError`
+        """
         if not self._wait:
             raise BotRuntimeError("行为操作未指定等待，无法获取响应")
 
         await self._resp_done.wait()
+        if self._resp_err is not None:
+            raise self._resp_err
         return self._resp
 
     def __await__(self):
@@ -257,7 +263,10 @@ class ActionHandle:
         ret = await self._exec_meth(self.action)
         if self._wait:
             ret = cast(asyncio.Future[ActionResponse], ret)
-            self._resp = await ret
+            try:
+                self._resp = await ret
+            except BotRuntimeError as e:
+                self._resp_err = e
             self._resp_done.set()
 
         self.status = "FINISHED"
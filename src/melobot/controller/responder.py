@@ -32,7 +32,7 @@ class BotResponder:
 
         try:
             if self.logger._check_level("DEBUG"):
-                self.logger.obj(resp.raw, f"收到 resp {resp:hexid}")
+                self.logger.obj(resp.raw, f"收到 resp {resp:hexid}", pretty=False)
 
             if resp.id is None:
                 return
@@ -74,3 +74,9 @@ class BotResponder:
 
         await self._action_sender._send(action)
         return fut
+
+    def _fail_wait(self, resp_id: str, exc: Exception) -> None:
+        """以异常结束一个响应等待，用于 action 未被发送的情况"""
+        resp_fut = self._resp_table.pop(resp_id, None)
+        if resp_fut is not None and not resp_fut.done():
+            resp_fut.set_exception(exc)
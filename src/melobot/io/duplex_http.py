@@ -80,9 +80,11 @@ class HttpConn(AbstractConnector):
         #: 操作鉴权的 access_token
         self.access_token = access_token
 
-        self._send_queue: asyncio.Queue["BotAction"] = asyncio.Queue()
+        self._send_queue: asyncio.Queue["BotAction"] = asyncio.Queue(
+            self.MAX_PENDING_ACTIONS
+        )
         self._pre_recv_time = time.time_ns()
-        self._pre_send_time = time.time_ns()
+        self._pre_send_time: float
 
         self._close_lock = asyncio.Lock()
         self._onebot_onlined = asyncio.Event()
@@ -183,7 +185,7 @@ class HttpConn(AbstractConnector):
         try:
             raw_event = json.loads(data.decode())
             if self.logger._check_level("DEBUG"):
-                self.logger.obj(raw_event, "收到上报，未格式化的字典")
+                self.logger.obj(raw_event, "收到上报，未格式化的字典", pretty=False)
 
             event = self._event_builder.try_build(raw_event)
             event = cast(BotEvent, event)
@@ -202,12 +204,13 @@ class HttpConn(AbstractConnector):
         await self._ready_signal.wait()
 
         await self._onebot_onlined.wait()
-        if self.slack:
-            self.logger.debug(f"action {action:hexid} 因 slack 状态被丢弃")
+        if not await self._prepare_action(action):
             return
-
-        await self._send_queue.put(action)
-        self.logger.debug(f"action {action:hexid} 已成功加入发送队列")
+        if not await self._queue_put(self._send_queue, action):
+            self._drop_action(action)
+            return
+        if self.logger._check_level("DEBUG"):
+            self.logger.debug(f"action {action:hexid} 已成功加入发送队列")
 
     async def _take_action(self, action: "BotAction") -> None:
         try:
@@ -246,22 +249,22 @@ class HttpConn(AbstractConnector):
         """真正的发送方法。从 send_queue 提取 action 并按照一些处理步骤操作"""
         await self._ready_signal.wait()
 
+        loop = asyncio.get_running_loop()
+        self._pre_send_time = loop.time()
+
         try:
             while True:
                 action = await self._send_queue.get()
                 await self._onebot_onlined.wait()
 
-                if self.logger._check_level("DEBUG"):
-                    self.logger.obj(action.__dict__, f"action {action:hexid} 准备发送")
-
-                await self._bot_bus.emit(BotLife.ACTION_PRESEND, action, wait=True)
-                self.logger.debug(f"action {action:hexid} presend hook 已完成")
-
-                wait_time = self.cd_time - ((time.time_ns() - self._pre_send_time) / 1e9)
-                await asyncio.sleep(wait_time)
+                debug = self.logger._check_level("DEBUG")
+                wait_time = self.cd_time - (loop.time() - self._pre_send_time)
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
                 asyncio.create_task(self._take_action(action))
-                self.logger.debug(f"action {action:hexid} 已发送")
-                self._pre_send_time = time.time_ns()
+                if debug:
+                    self.logger.debug(f"action {action:hexid} 已发送")
+                self._pre_send_time = loop.time()
 
         except asyncio.CancelledError:
             self.logger.debug("连接器发送队列监视任务已被结束")
@@ -1,5 +1,6 @@
 import asyncio
-import time
+from collections import deque
+from enum import Enum
 from itertools import count
 
 import websockets
@@ -15,6 +16,14 @@ if TYPE_CHECKING:
     from ..base.abc import BotAction
 
 
+class _ConnState(Enum):
+    """正向 websocket 连接器的连接状态"""
+
+    IDLE = 1
+    CONNECTING = 2
+    CONNECTED = 3
+
+
 class ForwardWsConn(AbstractConnector):
     """正向 websocket 连接器
 
@@ -58,20 +67,26 @@ class ForwardWsConn(AbstractConnector):
         #: 连接器操作鉴权的 token
         self.access_token = access_token
 
-        self._send_queue: asyncio.Queue["BotAction"] = asyncio.Queue()
-        self._pre_send_time = time.time_ns()
+        self._send_queue: deque[tuple["BotAction", str]] = deque()
+        self._send_wakeup: Optional[asyncio.Future[None]] = None
+        self._send_space = asyncio.Event()
+        self._send_space.set()
+        self._pre_send_time: float
 
-        self._conn_ready = asyncio.Event()
         self._reconn_flag = False
-        self._run_lock = asyncio.Lock()
+        self._conn_state = _ConnState.IDLE
 
     async def _run(self) -> None:
-        """运行客户端"""
+        """运行客户端。连接断开且允许重连时，在本方法内循环重新建立连接"""
+        if self._conn_state is not _ConnState.IDLE:
+            return
+
         headers: dict | None = None
         if self.access_token is not None:
             headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        async with self._run_lock:
+        while True:
+            self._conn_state = _ConnState.CONNECTING
             self._closed.clear()
             ok_flag = False
             retry_iter = count(0) if self.max_retry < 0 else range(self.max_retry + 1)
@@ -84,7 +99,10 @@ class ForwardWsConn(AbstractConnector):
                     await asyncio.sleep(self.retry_delay)
 
                 try:
-                    self.conn = await websockets.connect(self.url, extra_headers=headers)
+                    # OneBot 实现程序是受信任的对端：不限制消息大小，并关闭压缩以节省 CPU
+                    self.conn = await websockets.connect(
+                        self.url, extra_headers=headers, max_size=None, compression=None
+                    )
                     ok_flag = True
                     break
 
@@ -96,6 +114,7 @@ class ForwardWsConn(AbstractConnector):
                         self.logger.warning("403 错误可能是 access_token 未配置或无效")
 
             if not ok_flag:
+                self._conn_state = _ConnState.IDLE
                 self.logger.error("重试已达最大次数，已放弃建立连接")
                 self._close()
                 for task in asyncio.all_tasks():
@@ -103,8 +122,10 @@ class ForwardWsConn(AbstractConnector):
                 return
 
             try:
+                self._conn_state = _ConnState.CONNECTED
                 self.logger.info("连接器与 OneBot 实现程序建立了 ws 连接")
                 self._conn_ready.set()
+                self._sync_ready_gate()
                 asyncio.create_task(self._listen())
                 await self._closed.wait()
             finally:
@@ -112,21 +133,28 @@ class ForwardWsConn(AbstractConnector):
                     await self.conn.close()
                     await self.conn.wait_closed()
                     self.logger.info("与 OneBot 实现程序的连接已关闭")
+                self._conn_state = _ConnState.IDLE
+
+            # 由 _close 主动关闭时 allow_reconn 已被置否，否则是 _reconnect 触发的重连
+            if not self.allow_reconn:
+                return
 
     def _close(self) -> None:
         """关闭连接"""
+        self.allow_reconn = False
         if self._closed.is_set():
             return
         else:
-            self.allow_reconn = False
             self._closed.set()
 
     async def _reconnect(self) -> None:
-        """关闭已经无效的连接，随后开始尝试建立新连接"""
+        """关闭已经无效的连接，随后由 _run 开始尝试建立新连接"""
+        if self._conn_state is not _ConnState.CONNECTED:
+            return
         self._conn_ready.clear()
-        self._closed.set()
+        self._sync_ready_gate()
         self._reconn_flag = True
-        asyncio.create_task(self._run())
+        self._closed.set()
 
     async def __aenter__(self) -> "ForwardWsConn":
         asyncio.create_task(self._run())
@@ -146,39 +174,69 @@ class ForwardWsConn(AbstractConnector):
 
     async def _send(self, action: "BotAction") -> None:
         """发送一个 action 给连接器。实际上是先提交到 send_queue"""
-        await self._ready_signal.wait()
-        await self._conn_ready.wait()
+        if not self._fully_ready.is_set():
+            await self._fully_ready.wait()
 
-        if self.slack:
-            self.logger.debug(f"action {action:hexid} 因 slack 状态被丢弃")
+        if not await self._prepare_action(action):
             return
+        action_str = action.flatten()
+
+        if len(self._send_queue) >= self.MAX_PENDING_ACTIONS:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.SEND_ENQUEUE_TIMEOUT
+            # 被唤醒后需重新检查：可能有多个等待者同时被唤醒，检查与入队之间不能有 await
+            while len(self._send_queue) >= self.MAX_PENDING_ACTIONS:
+                self._send_space.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._send_space.wait(), deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    self._drop_action(action)
+                    return
 
-        await self._send_queue.put(action)
-        self.logger.debug(f"action {action:hexid} 已成功加入发送队列")
+        self._send_queue.append((action, action_str))
+        fut = self._send_wakeup
+        if fut is not None and not fut.done():
+            fut.set_result(None)
+        if self.logger._check_level("DEBUG"):
+            self.logger.debug(f"action {action:hexid} 已成功加入发送队列")
 
     async def _watch_queue(self) -> None:
         """真正的发送方法。从 send_queue 提取 action 并按照一些处理步骤操作"""
         await self._ready_signal.wait()
 
+        loop = asyncio.get_running_loop()
+        self._pre_send_time = loop.time()
+
         try:
             while True:
-                action = await self._send_queue.get()
-                await self._conn_ready.wait()
+                # 队列为空时挂起，直到 _send 放入新的 action 后唤醒
+                if not self._send_queue:
+                    self._send_wakeup = loop.create_future()
+                    await self._send_wakeup
+                    self._send_wakeup = None
 
-                if self.logger._check_level("DEBUG"):
-                    self.logger.obj(action.__dict__, f"action {action:hexid} 准备发送")
+                cd_time = self.cd_time
+                debug = self.logger._check_level("DEBUG")
+                while self._send_queue:
+                    if not self._fully_ready.is_set():
+                        await self._fully_ready.wait()
 
-                await self._bot_bus.emit(BotLife.ACTION_PRESEND, action, wait=True)
-                self.logger.debug(f"action {action:hexid} presend hook 已完成")
+                    action, action_str = self._send_queue.popleft()
+                    self._send_space.set()
 
-                action_str = action.flatten()
-                wait_time = self.cd_time - ((time.time_ns() - self._pre_send_time) / 1e9)
-                await asyncio.sleep(wait_time)
+                    wait_time = cd_time - (loop.time() - self._pre_send_time)
+                    if wait_time > 0:
+                        await asyncio.sleep(wait_time)
 
-                self.conn = cast("websockets.client.WebSocketClientProtocol", self.conn)
-                await self.conn.send(action_str)
-                self.logger.debug(f"action {action:hexid} 已发送")
-                self._pre_send_time = time.time_ns()
+                    self.conn = cast(
+                        "websockets.client.WebSocketClientProtocol", self.conn
+                    )
+                    await self.conn.send(action_str)
+                    if debug:
+                        self.logger.debug(f"action {action:hexid} 已发送")
+                    self._pre_send_time = loop.time()
 
         except asyncio.CancelledError:
             self.logger.debug("连接器发送队列监视任务已被结束")
@@ -187,8 +245,8 @@ class ForwardWsConn(AbstractConnector):
 
     async def _listen(self) -> None:
         """从 OneBot 实现程序接收一个事件，并处理"""
-        await self._ready_signal.wait()
-        await self._conn_ready.wait()
+        if not self._fully_ready.is_set():
+            await self._fully_ready.wait()
 
         if not self._reconn_flag:
             await self._bot_bus.emit(BotLife.FIRST_CONNECTED)
@@ -205,7 +263,7 @@ class ForwardWsConn(AbstractConnector):
                     )
                     raw = await self.conn.recv()
                     if self.logger._check_level("DEBUG"):
-                        self.logger.obj(raw, "收到上报，未格式化的字符串")
+                        self.logger.obj(raw, "收到上报，未格式化的字符串", pretty=False)
 
                     event = self._event_builder.try_build(raw)
                     if event is None:
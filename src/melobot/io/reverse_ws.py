@@ -1,6 +1,5 @@
 import asyncio
 import http
-import time
 
 import websockets
 import websockets.exceptions as wse
@@ -49,12 +48,13 @@ class ReverseWsConn(AbstractConnector):
         self.access_token = access_token
 
         self._conn: "websockets.server.WebSocketServerProtocol"
-        self._send_queue: asyncio.Queue["BotAction"] = asyncio.Queue()
-        self._pre_send_time = time.time_ns()
+        self._send_queue: asyncio.Queue[tuple["BotAction", str]] = asyncio.Queue(
+            self.MAX_PENDING_ACTIONS
+        )
+        self._pre_send_time: float
 
         self._conn_requested = False
         self._request_lock = asyncio.Lock()
-        self._conn_ready = asyncio.Event()
         self._reconn_flag = False
 
     async def _req_check(
@@ -89,8 +89,13 @@ class ReverseWsConn(AbstractConnector):
     async def _run(self) -> None:
         """运行服务"""
         self._closed.clear()
+        # 服务端可能被任意客户端连接，因此保留默认的消息大小限制，仅关闭压缩
         self.server = await websockets.serve(
-            self._listen, self.host, self.port, process_request=self._req_check
+            self._listen,
+            self.host,
+            self.port,
+            process_request=self._req_check,
+            compression=None,
         )
         self.logger.info("连接器启动了 ws 服务，等待 ws 连接中")
 
@@ -110,6 +115,7 @@ class ReverseWsConn(AbstractConnector):
         """在客户端主动断开连接后，重置到可以接受新连接的状态"""
         self.logger.warning("OneBot 实现程序主动断开连接，等待其重连中")
         self._conn_ready.clear()
+        self._sync_ready_gate()
         self._conn_requested = False
         del self._conn
         self._reconn_flag = True
@@ -132,38 +138,41 @@ class ReverseWsConn(AbstractConnector):
 
     async def _send(self, action: "BotAction") -> None:
         """发送一个 action 给连接器，实际上是先提交到 send_queue"""
-        await self._ready_signal.wait()
-        await self._conn_ready.wait()
+        if not self._fully_ready.is_set():
+            await self._fully_ready.wait()
 
-        if self.slack:
-            self.logger.debug(f"action {action:hexid} 因 slack 状态被丢弃")
+        if not await self._prepare_action(action):
             return
+        action_str = action.flatten()
 
-        await self._send_queue.put(action)
-        self.logger.debug(f"action {action:hexid} 已成功加入发送队列")
+        if not await self._queue_put(self._send_queue, (action, action_str)):
+            self._drop_action(action)
+            return
+        if self.logger._check_level("DEBUG"):
+            self.logger.debug(f"action {action:hexid} 已成功加入发送队列")
 
     async def _watch_queue(self) -> None:
         """真正的发送方法。从 send_queue 提取 action 并按照一些处理步骤操作"""
         await self._ready_signal.wait()
 
+        loop = asyncio.get_running_loop()
+        self._pre_send_time = loop.time()
+
         try:
             while True:
-                action = await self._send_queue.get()
-                await self._conn_ready.wait()
-
-                if self.logger._check_level("DEBUG"):
-                    self.logger.obj(action.__dict__, f"action {action:hexid} 准备发送")
-
-                await self._bot_bus.emit(BotLife.ACTION_PRESEND, action, wait=True)
-                self.logger.debug(f"action {action:hexid} presend hook 已完成")
+                action, action_str = await self._send_queue.get()
+                if not self._fully_ready.is_set():
+                    await self._fully_ready.wait()
 
-                action_str = action.flatten()
-                wait_time = self.cd_time - ((time.time_ns() - self._pre_send_time) / 1e9)
-                await asyncio.sleep(wait_time)
+                debug = self.logger._check_level("DEBUG")
+                wait_time = self.cd_time - (loop.time() - self._pre_send_time)
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
 
                 await self._conn.send(action_str)
-                self.logger.debug(f"action {action:hexid} 已发送")
-                self._pre_send_time = time.time_ns()
+                if debug:
+                    self.logger.debug(f"action {action:hexid} 已发送")
+                self._pre_send_time = loop.time()
 
         except asyncio.CancelledError:
             self.logger.debug("连接器发送队列监视任务已被结束")
@@ -175,6 +184,7 @@ class ReverseWsConn(AbstractConnector):
         await self._ready_signal.wait()
         self._conn = ws
         self._conn_ready.set()
+        self._sync_ready_gate()
         self.logger.info("连接器与 OneBot 实现程序建立了 ws 连接")
 
         if not self._reconn_flag:
@@ -190,7 +200,7 @@ class ReverseWsConn(AbstractConnector):
                     raw = await self._conn.recv()
 
                     if self.logger._check_level("DEBUG"):
-                        self.logger.obj(raw, "收到上报，未格式化的字符串")
+                        self.logger.obj(raw, "收到上报，未格式化的字符串", pretty=False)
 
                     event = self._event_builder.try_build(raw)
                     if event is None:
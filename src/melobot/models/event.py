@@ -2,7 +2,7 @@ import json
 import re
 
 from ..base.abc import BotEvent
-from ..base.typing import Any, Callable, Literal, MsgSegment, Optional, cast
+from ..base.typing import Any, Callable, EventKind, Literal, MsgSegment, Optional, cast
 from .msg import get_seg_datas, get_segs, to_cq_str, to_segments
 
 
@@ -36,6 +36,8 @@ class MessageEvent(BotEvent):
        一般无需手动实例化该类，多数情况会直接使用本类对象，或将本类用作类型注解。
     """
 
+    kind = EventKind.MESSAGE
+
     def __init__(self, raw: dict) -> None:
         super().__init__(raw)
         #: 收到事件的机器人 qq 号
@@ -296,6 +298,8 @@ class RequestEvent(BotEvent):
        一般无需手动实例化该类，多数情况会直接使用本类对象，或将本类用作类型注解。
     """
 
+    kind = EventKind.REQUEST
+
     def __init__(self, raw: dict) -> None:
         super().__init__(raw)
 
@@ -360,6 +364,8 @@ class NoticeEvent(BotEvent):
        `print(event.__dict__)` 或调试器查看。
     """
 
+    kind = EventKind.NOTICE
+
     def __init__(self, raw: dict) -> None:
         super().__init__(raw)
         #: 收到事件的机器人 qq 号
@@ -625,6 +631,8 @@ class MetaEvent(BotEvent):
        一般无需手动实例化该类，多数情况会直接使用本类对象，或将本类用作类型注解。
     """
 
+    kind = EventKind.META
+
     def __init__(self, raw: dict) -> None:
         super().__init__(raw)
         #: 收到事件的机器人 qq 号
@@ -1,4 +1,5 @@
 import io
+import json
 import logging
 import logging.config
 import logging.handlers
@@ -19,8 +20,38 @@ _CONSOLE_IO = io.StringIO()
 _CONSOLE = rich.console.Console(file=_CONSOLE_IO, record=True, color_system="windows")
 
 
-def get_rich_str(obj: object, max_len: Optional[int] = 1000) -> tuple[str, str]:
-    """返回使用 rich 格式化的 object"""
+def _truncate_strs(obj: Any, max_len: int) -> Any:
+    """将对象中过长的字符串截断到 `max_len`，与 rich 的 `max_string` 行为一致"""
+    if isinstance(obj, str):
+        if len(obj) > max_len:
+            return f"{obj[:max_len]}...+{len(obj) - max_len}"
+        return obj
+    if isinstance(obj, dict):
+        return {k: _truncate_strs(v, max_len) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_truncate_strs(v, max_len) for v in obj]
+    return obj
+
+
+def get_rich_str(
+    obj: object, max_len: Optional[int] = 1000, pretty: bool = True
+) -> tuple[str, str]:
+    """返回使用 rich 格式化的 object
+
+    `pretty` 为 `False` 时不经过 rich 渲染，直接使用 json 序列化（无法序列化时使用 repr），
+    速度快得多，适合在收发等频繁调用处使用。此时返回的两个字符串相同。
+    """
+    if not pretty:
+        if max_len is not None:
+            obj = _truncate_strs(obj, max_len)
+        if isinstance(obj, str):
+            return obj, obj
+        try:
+            plain_str = json.dumps(obj, ensure_ascii=False, indent=2, default=repr)
+        except (TypeError, ValueError):
+            plain_str = repr(obj)
+        return plain_str, plain_str
+
     _CONSOLE.print(
         rich.pretty.Pretty(
             obj,
@@ -54,8 +85,8 @@ class ObjectFilter(logging.Filter):
         self.obj = ""
         self.colored_obj = ""
 
-    def set(self, obj: Any) -> None:
-        self.colored_obj, self.obj = get_rich_str(obj)
+    def set(self, obj: Any, pretty: bool = True) -> None:
+        self.colored_obj, self.obj = get_rich_str(obj, pretty=pretty)
         self.colored_obj += "\n"
         self.obj += "\n"
 
@@ -288,6 +319,7 @@ class BotLogger(Logger):
         prefix: str,
         prefix_fmt: str = "%s：\n",
         level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "DEBUG",
+        pretty: bool = True,
     ) -> None:
         """在日志时记录指定的对象
 
@@ -295,15 +327,16 @@ class BotLogger(Logger):
         :param prefix: 记录时的前缀信息
         :param prefix_fmt: 前缀信息的格式化字符串
         :param level: 记录的日志等级，默认为 DEBUG
+        :param pretty: 是否使用 rich 美化输出。为 `False` 时使用更快的 json 序列化
         """
         log_meth = getattr(self, level.lower())
 
         if isinstance(self, BotLogger):
-            self._obj_filter.set(obj)
+            self._obj_filter.set(obj, pretty)
             log_meth(prefix_fmt % prefix)
             self._obj_filter.clear()
         else:
-            log_meth(f"{prefix_fmt % prefix}{get_rich_str(obj)[1]}")
+            log_meth(f"{prefix_fmt % prefix}{get_rich_str(obj, pretty=pretty)[1]}")
 
 
 def logger_patch(